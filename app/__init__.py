@@ -1,3 +1,4 @@
+import click
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
@@ -5,8 +6,11 @@ from flask_migrate import Migrate
 import redis
 from pymongo import MongoClient
 import logging
+import logging.handlers
 import os
+import threading
 from config import config
+from app.json_provider import OrjsonProvider
 
 # Initialize extensions
 db = SQLAlchemy()
@@ -19,32 +23,85 @@ def create_app(config_name='default'):
     
     app = Flask(__name__)
     app.config.from_object(config[config_name])
+    app.json = OrjsonProvider(app)
     
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
-    CORS(app)
+    CORS(app, resources={r'/api/*': {'origins': app.config['CORS_ORIGINS']}})
     
     # Initialize Redis
     global redis_client
-    redis_client = redis.from_url(app.config['REDIS_URL'])
+    redis_client = redis.from_url(
+        app.config['REDIS_URL'],
+        max_connections=app.config['REDIS_MAX_CONNECTIONS'],
+        health_check_interval=30,
+        socket_connect_timeout=app.config['REDIS_SOCKET_TIMEOUT'],
+        socket_timeout=app.config['REDIS_SOCKET_TIMEOUT'],
+        socket_keepalive=True
+    )
     
     # Initialize MongoDB
     global mongo_client
-    mongo_client = MongoClient(app.config['MONGODB_URI'])
+    mongo_client = MongoClient(
+        app.config['MONGODB_URI'],
+        maxPoolSize=app.config['MONGODB_MAX_POOL_SIZE'],
+        minPoolSize=app.config['MONGODB_MIN_POOL_SIZE']
+    )
     
     # Setup logging
     setup_logging(app)
     
     # Register blueprints
     register_blueprints(app)
+    register_commands(app)
     
-    # Create database tables
-    with app.app_context():
-        db.create_all()
+    # Create database tables (production schemas are managed by migrations: flask db upgrade)
+    if app.config['AUTO_CREATE_TABLES']:
+        with app.app_context():
+            db.create_all()
     
     return app
 
+# Open buffering handlers, whose flusher threads are restarted in forked workers
+_periodic_flush_handlers = set()
+
+class PeriodicFlushHandler(logging.handlers.MemoryHandler):
+    """Memory handler that also flushes its buffer every few seconds"""
+    
+    def __init__(self, capacity, flush_interval, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.flush_interval = flush_interval
+        self._stopped = threading.Event()
+        _periodic_flush_handlers.add(self)
+        self._start_flusher()
+    
+    def _start_flusher(self):
+        """Start a daemon thread that flushes the buffer periodically"""
+        threading.Thread(target=self._flush_periodically, daemon=True).start()
+    
+    def _flush_periodically(self):
+        """Flush the buffer so records on a quiet worker are not held indefinitely"""
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self):
+        """Stop the flusher thread, then flush and close this handler and its target"""
+        self._stopped.set()
+        _periodic_flush_handlers.discard(self)
+        
+        target = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
+def _restart_flushers():
+    """Restart flusher threads in a forked child, since threads do not survive fork"""
+    for handler in list(_periodic_flush_handlers):
+        handler._start_flusher()
+
+os.register_at_fork(after_in_child=_restart_flushers)
+
 def setup_logging(app):
     """Setup application logging"""
     
@@ -53,15 +110,30 @@ def setup_logging(app):
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
     
-    # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, app.config['LOG_LEVEL']),
-        format='%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]',
-        handlers=[
-            logging.FileHandler(app.config['LOG_FILE']),
-            logging.StreamHandler()
-        ]
-    )
+    log_format = '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
+    
+    # basicConfig does nothing once the root logger has handlers (e.g. a second
+    # create_app), so only build handlers that will actually be installed
+    if not logging.getLogger().handlers:
+        # Buffer file writes; errors flush the buffer immediately, everything else within seconds
+        file_target = logging.FileHandler(app.config['LOG_FILE'])
+        file_target.setFormatter(logging.Formatter(log_format))
+        file_handler = PeriodicFlushHandler(
+            capacity=app.config['LOG_BUFFER_CAPACITY'],
+            flush_interval=app.config['LOG_FLUSH_INTERVAL'],
+            flushLevel=logging.ERROR,
+            target=file_target
+        )
+        
+        # Configure logging
+        logging.basicConfig(
+            level=getattr(logging, app.config['LOG_LEVEL']),
+            format=log_format,
+            handlers=[
+                file_handler,
+                logging.StreamHandler()
+            ]
+        )
     
     app.logger.info('Tourism Dashboard startup')
 
@@ -74,5 +146,23 @@ def register_blueprints(app):
     app.register_blueprint(dashboard_bp, url_prefix='/dashboard')
     app.register_blueprint(api_bp, url_prefix='/api')
 
+def register_commands(app):
+    """Register Flask CLI commands"""
+    
+    @app.cli.command('backfill-arrival-rollup')
+    def backfill_arrival_rollup():
+        """Rebuild the daily arrival rollup from the fact tables.
+
+        Run once after the migration that creates the table, before serving
+        /api/analytics/summary, e.g.
+        flask --app "app:create_app('production')" db upgrade
+        flask --app "app:create_app('production')" backfill-arrival-rollup
+        """
+        from app.services import DataCollector
+        
+        if not DataCollector().refresh_arrival_rollup():
+            raise click.ClickException('Backfilling the daily arrival rollup failed; see the log')
+        click.echo('Daily arrival rollup is up to date')
+
 # Import models to ensure they are registered with SQLAlchemy
 from app.models import tourist_data, accommodation, sentiment, revenue
\ No newline at end of file
@@ -2,4 +2,4 @@ from flask import Blueprint
 
 api_bp = Blueprint('api', __name__)
 
-from . import routes
\ No newline at end of file
+from . import errors, routes
\ No newline at end of file
@@ -0,0 +1,34 @@
+from flask import jsonify, request
+from werkzeug.exceptions import HTTPException
+from app.api import api_bp
+import logging
+
+logger = logging.getLogger(__name__)
+
+class APIError(Exception):
+    """Client error returned to the caller as JSON without being logged"""
+    
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+@api_bp.errorhandler(APIError)
+def handle_api_error(error):
+    """Convert a client error into a JSON response"""
+    return jsonify({
+        'success': False,
+        'error': error.message
+    }), error.status_code
+
+@api_bp.errorhandler(Exception)
+def handle_unexpected_error(error):
+    """Log an unexpected error and return it as a JSON 500 response"""
+    if isinstance(error, HTTPException):
+        return error
+    
+    logger.exception("Error handling %s: %s", request.endpoint, error)
+    return jsonify({
+        'success': False,
+        'error': str(error)
+    }), 500
@@ -1,343 +1,588 @@
-from flask import jsonify, request
+from flask import current_app, jsonify, request
 from app.api import api_bp
+from app.api.errors import APIError
 from app import db
-from app.models import TouristArrival, TouristSource, Destination, Hotel, Booking, Occupancy, Revenue
+from app.models import TouristArrival, TouristSource, Destination, DailyArrivalRollup, Hotel, Booking, Occupancy, Revenue
 from app.services import DataCollector
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.exc import SQLAlchemyError
+from urllib.parse import urlencode
+import functools
+import gzip
 import logging
+import os
+import time
+import orjson
+import pymongo
+import redis
 
 logger = logging.getLogger(__name__)
 
+# Namespace of cached API responses; each entry is a hash of body and fresh_until
+RESPONSE_CACHE_PREFIX = 'response:v2:'
+
+# Pre-serialized body for the rejection path, which can fire on every request of a burst
+RATE_LIMITED_BODY = orjson.dumps({'success': False, 'error': 'Rate limit exceeded'})
+
+# Collection steps by data_type; 'all' goes through DataCollector.collect_all_data
+DATA_COLLECTORS = {
+    'arrivals': lambda collector, start_date, end_date: collector.collect_tourist_arrivals(start_date, end_date),
+    'hotels': lambda collector, start_date, end_date: collector.collect_hotel_data(),
+    'revenue': lambda collector, start_date, end_date: collector.collect_revenue_data(start_date, end_date),
+    'weather': lambda collector, start_date, end_date: collector.collect_weather_data()
+}
+
+# Columns selected by the list endpoints, in the same order and under the same
+# keys as the models' to_dict(); related names come from joins, not lazy loads
+ARRIVAL_COLUMNS = (
+    TouristArrival.id,
+    TouristArrival.date,
+    TouristArrival.total_arrivals,
+    TouristArrival.male_count,
+    TouristArrival.female_count,
+    TouristArrival.children_count,
+    TouristSource.name.label('source_country'),
+    Destination.name.label('destination'),
+    TouristArrival.purpose_of_visit,
+    TouristArrival.duration_of_stay,
+    TouristArrival.accommodation_type,
+    TouristArrival.created_at,
+    TouristArrival.updated_at
+)
+
+REVENUE_COLUMNS = (
+    Revenue.id,
+    Revenue.date,
+    Revenue.total_revenue,
+    Revenue.accommodation_revenue,
+    Revenue.food_beverage_revenue,
+    Revenue.transportation_revenue,
+    Revenue.entertainment_revenue,
+    Revenue.shopping_revenue,
+    Revenue.other_revenue,
+    Revenue.currency,
+    Revenue.exchange_rate,
+    Revenue.revenue_usd,
+    Destination.name.label('destination'),
+    TouristSource.name.label('source_country'),
+    Revenue.average_spending_per_tourist,
+    Revenue.total_tourists,
+    Revenue.season,
+    Revenue.is_holiday_period,
+    Revenue.special_event,
+    Revenue.created_at,
+    Revenue.updated_at
+)
+
+HOTEL_COLUMNS = (
+    Hotel.id,
+    Hotel.name,
+    Hotel.category,
+    Hotel.type,
+    Destination.name.label('destination'),
+    Hotel.address,
+    Hotel.latitude,
+    Hotel.longitude,
+    Hotel.total_rooms,
+    Hotel.available_rooms,
+    Hotel.average_price,
+    Hotel.price_range,
+    Hotel.average_rating,
+    Hotel.total_reviews,
+    Hotel.amenities,
+    Hotel.facilities,
+    Hotel.phone,
+    Hotel.email,
+    Hotel.website,
+    Hotel.is_active,
+    Hotel.created_at,
+    Hotel.updated_at
+)
+
+OCCUPANCY_COLUMNS = (
+    Occupancy.id,
+    Hotel.name.label('hotel_name'),
+    Occupancy.date,
+    Occupancy.total_rooms,
+    Occupancy.occupied_rooms,
+    Occupancy.available_rooms,
+    Occupancy.occupancy_rate,
+    Occupancy.average_daily_rate,
+    Occupancy.revenue_per_available_room,
+    Occupancy.check_ins,
+    Occupancy.check_outs,
+    Occupancy.cancellations,
+    Occupancy.created_at,
+    Occupancy.updated_at
+)
+
+DESTINATION_COLUMNS = (
+    Destination.id,
+    Destination.name,
+    Destination.category,
+    Destination.province,
+    Destination.district,
+    Destination.latitude,
+    Destination.longitude,
+    Destination.total_visitors,
+    Destination.average_rating,
+    Destination.popularity_score,
+    Destination.features,
+    Destination.activities,
+    Destination.is_active,
+    Destination.created_at,
+    Destination.updated_at
+)
+
+SOURCE_COUNTRY_COLUMNS = (
+    TouristSource.id,
+    TouristSource.name,
+    TouristSource.code,
+    TouristSource.region,
+    TouristSource.total_tourists,
+    TouristSource.average_stay_duration,
+    TouristSource.average_spending,
+    TouristSource.is_active,
+    TouristSource.created_at,
+    TouristSource.updated_at
+)
+
+# Last formatted timestamp, refreshed at most once per second
+_timestamp_cache = [0, '']
+
+def _now_iso():
+    """Get the current time as an ISO string at one-second resolution"""
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[:] = [now, datetime.fromtimestamp(now).isoformat()]
+    return _timestamp_cache[1]
+
+def rate_limited(limit_setting, window_setting):
+    """Reject clients that exceed a request budget per time window"""
+    
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            from app import redis_client
+            
+            limit = current_app.config[limit_setting]
+            window = current_app.config[window_setting]
+            key = f"ratelimit:{request.endpoint}:{request.remote_addr}:{int(time.time() // window)}"
+            
+            # Count and expire in a single round trip; fail open if Redis is down
+            try:
+                pipe = redis_client.pipeline(transaction=False)
+                pipe.incr(key)
+                pipe.expire(key, window)
+                count = pipe.execute()[0]
+            except (AttributeError, redis.RedisError) as e:
+                logger.warning("Rate limiting unavailable: %s", e)
+                return view(*args, **kwargs)
+            
+            if count > limit:
+                return current_app.response_class(
+                    RATE_LIMITED_BODY, status=429, mimetype='application/json'
+                )
+            
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def cached_response(ttl_setting, params=()):
+    """Serve repeated GETs from a Redis copy of the serialized response body"""
+    
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            from app import redis_client
+            
+            ttl = current_app.config[ttl_setting]
+            
+            # Keyed only by the parameters the view reads, so unknown ones cannot mint new entries
+            query = urlencode(_cache_key_params(params))
+            key = f"{RESPONSE_CACHE_PREFIX}{request.endpoint}:{query}"
+            
+            try:
+                cached = redis_client.hgetall(key)
+            except (AttributeError, redis.RedisError) as e:
+                logger.warning("Response cache unavailable: %s", e)
+                return view(*args, **kwargs)
+            
+            body = cached.get(b'body')
+            fresh = body is not None and float(cached[b'fresh_until']) > time.time()
+            stale = False
+            
+            if not fresh:
+                try:
+                    response = current_app.make_response(view(*args, **kwargs))
+                except SQLAlchemyError as e:
+                    # Keep serving the last good copy while the database is failing
+                    if body is None:
+                        raise
+                    logger.warning("Serving stale %s response after database error: %s", request.endpoint, e)
+                    stale = True
+                else:
+                    if response.status_code != 200:
+                        return response
+                    
+                    # Bodies are compressed once when stored, not on every hit
+                    body = gzip.compress(response.get_data(), compresslevel=6, mtime=0)
+                    try:
+                        pipe = redis_client.pipeline(transaction=False)
+                        pipe.hset(key, mapping={'body': body, 'fresh_until': time.time() + ttl})
+                        pipe.expire(key, current_app.config['RESPONSE_STALE_TTL'])
+                        pipe.execute()
+                    except redis.RedisError as e:
+                        logger.warning("Response cache unavailable: %s", e)
+            
+            if request.accept_encodings['gzip']:
+                response = current_app.response_class(body, mimetype='application/json')
+                response.content_encoding = 'gzip'
+            else:
+                response = current_app.response_class(gzip.decompress(body), mimetype='application/json')
+            response.vary.add('Accept-Encoding')
+            
+            # Let polling clients revalidate with If-None-Match and get an empty 304
+            response.add_etag()
+            if stale:
+                # Clients must not hold on to a fallback copy once the database recovers
+                response.cache_control.no_cache = True
+            else:
+                response.cache_control.public = True
+                response.cache_control.max_age = ttl
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+def _cache_key_params(params):
+    """Get the named query parameters as the views parse them, so equivalent spellings share a key"""
+    values = []
+    for name in params:
+        if name == 'limit':
+            value = _request_limit()
+        elif name in ('start_date', 'end_date'):
+            value = _parse_date(request.args.get(name), name)
+        else:
+            value = request.args.get(name)
+        if value:
+            values.append((name, value))
+    return values
+
+def _invalidate_response_cache():
+    """Drop every cached API response, e.g. after new data is collected"""
+    from app import redis_client
+    
+    try:
+        keys = list(redis_client.scan_iter(match=f"{RESPONSE_CACHE_PREFIX}*", count=500))
+        if keys:
+            redis_client.unlink(*keys)
+    except (AttributeError, redis.RedisError) as e:
+        logger.warning("Response cache unavailable: %s", e)
+
+def _parse_date(value, name):
+    """Parse a YYYY-MM-DD query parameter, rejecting malformed values"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise APIError(f'Invalid {name}: expected YYYY-MM-DD')
+
+def _parse_date_range(args):
+    """Get the start date and the exclusive upper bound for an inclusive end_date"""
+    start_date = _parse_date(args.get('start_date'), 'start_date')
+    end_date = _parse_date(args.get('end_date'), 'end_date')
+    # The last representable day has no successor, and nothing lies beyond it anyway
+    end_before = end_date + timedelta(days=1) if end_date and end_date < date.max else None
+    return start_date, end_before
+
+def _json_list(value):
+    """Decode a JSON list stored in a text column, as the model getters do"""
+    if not value:
+        return []
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return []
+
+def _rows_to_dicts(rows, json_fields=()):
+    """Convert selected rows to response dicts"""
+    data = [row._asdict() for row in rows]
+    for item in data:
+        for field in json_fields:
+            item[field] = _json_list(item[field])
+    return data
+
+def _request_limit(default=100):
+    """Get the row limit from the query string, clamped to the configured maximum"""
+    limit = request.args.get('limit', default, type=int)
+    return min(max(limit, 1), current_app.config['MAX_LIST_LIMIT'])
+
+def _filter_query(query, date_column=None, **equality_columns):
+    """Apply the date range and equality filters given in the query string"""
+    if date_column is not None:
+        start_date, end_before = _parse_date_range(request.args)
+        if start_date:
+            query = query.filter(date_column >= start_date)
+        if end_before:
+            query = query.filter(date_column < end_before)
+    
+    # Each keyword names a query parameter and the column it must equal
+    for name, column in equality_columns.items():
+        value = request.args.get(name)
+        if value:
+            query = query.filter(column == value)
+    return query
+
+def _list_response(rows, json_fields=()):
+    """Build a list response from fetched rows"""
+    return jsonify({
+        'success': True,
+        'data': _rows_to_dicts(rows, json_fields),
+        'count': len(rows)
+    })
+
+def _top_arrivals_json(entity, rollup_key):
+    """Build a subquery returning the five entities with most arrivals as a JSON array"""
+    # Grouped by key as well as name so two rows sharing a name stay separate
+    top = select(
+        entity.name,
+        db.func.sum(DailyArrivalRollup.total_arrivals).label('arrivals')
+    ).join(
+        DailyArrivalRollup, rollup_key == entity.id
+    ).group_by(entity.id, entity.name).order_by(
+        db.desc('arrivals')
+    ).limit(5).subquery()
+    
+    return select(
+        db.func.coalesce(
+            db.func.json_agg(aggregate_order_by(
+                db.func.json_build_object('name', top.c.name, 'arrivals', top.c.arrivals),
+                top.c.arrivals.desc()
+            )),
+            db.text("'[]'::json")
+        )
+    ).scalar_subquery()
+
+@functools.lru_cache(maxsize=1)
+def _get_collector():
+    """Get the shared data collector, creating it on first use"""
+    return DataCollector()
+
+# A collector built in a preloading master would share its HTTP connections with every worker
+os.register_at_fork(after_in_child=_get_collector.cache_clear)
+
 @api_bp.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': _now_iso(),
         'service': 'Sri Lanka Tourism Analytics API'
     })
 
+@api_bp.route('/health/deep', methods=['GET'])
+def deep_health_check():
+    """Health check that verifies the database, Redis and MongoDB connections"""
+    from app import redis_client, mongo_client
+    
+    timeout = current_app.config['HEALTH_CHECK_TIMEOUT']
+    
+    def ping_database():
+        # Connecting is bounded by DATABASE_CONNECT_TIMEOUT; SET LOCAL ends with the transaction
+        with db.engine.connect() as connection:
+            connection.execute(db.text(f"SET LOCAL statement_timeout = {int(timeout * 1000)}"))
+            connection.execute(db.text('SELECT 1'))
+    
+    def ping_mongodb():
+        # Bounds server selection too, which otherwise waits 30s for a down server
+        with pymongo.timeout(timeout):
+            mongo_client.admin.command('ping')
+    
+    # Kept off /health so frequent liveness probes never touch the backends;
+    # Redis is bounded by the client's REDIS_SOCKET_TIMEOUT
+    checks = {
+        'database': ping_database,
+        'redis': lambda: redis_client.ping(),
+        'mongodb': ping_mongodb
+    }
+    
+    components = {}
+    for name, check in checks.items():
+        try:
+            check()
+            components[name] = 'healthy'
+        except Exception as e:
+            logger.warning("Health check for %s failed: %s", name, e)
+            components[name] = 'unhealthy'
+    
+    healthy = all(status == 'healthy' for status in components.values())
+    
+    return jsonify({
+        'status': 'healthy' if healthy else 'unhealthy',
+        'timestamp': _now_iso(),
+        'components': components
+    }), 200 if healthy else 503
+
 @api_bp.route('/tourist-arrivals', methods=['GET'])
+@cached_response('TIME_SERIES_CACHE_TTL', params=('start_date', 'end_date', 'destination_id', 'source_country_id', 'limit'))
 def get_tourist_arrivals():
     """Get tourist arrival data"""
-    try:
-        # Get query parameters
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        destination_id = request.args.get('destination_id')
-        source_country_id = request.args.get('source_country_id')
-        limit = request.args.get('limit', 100, type=int)
-        
-        # Build query
-        query = TouristArrival.query
-        
-        if start_date:
-            query = query.filter(TouristArrival.date >= start_date)
-        if end_date:
-            query = query.filter(TouristArrival.date <= end_date)
-        if destination_id:
-            query = query.filter(TouristArrival.destination_id == destination_id)
-        if source_country_id:
-            query = query.filter(TouristArrival.source_country_id == source_country_id)
-        
-        # Execute query
-        arrivals = query.order_by(TouristArrival.date.desc()).limit(limit).all()
-        
-        return jsonify({
-            'success': True,
-            'data': [arrival.to_dict() for arrival in arrivals],
-            'count': len(arrivals)
-        })
-        
-    except Exception as e:
-        logger.error(f"Error getting tourist arrivals: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    query = db.session.query(*ARRIVAL_COLUMNS).join(
+        TouristSource, TouristArrival.source_country_id == TouristSource.id
+    ).join(
+        Destination, TouristArrival.destination_id == Destination.id
+    )
+    query = _filter_query(
+        query,
+        TouristArrival.date,
+        destination_id=TouristArrival.destination_id,
+        source_country_id=TouristArrival.source_country_id
+    )
+    
+    return _list_response(query.order_by(TouristArrival.date.desc()).limit(_request_limit()).all())
 
 @api_bp.route('/revenue', methods=['GET'])
+@cached_response('TIME_SERIES_CACHE_TTL', params=('start_date', 'end_date', 'destination_id', 'source_country_id', 'limit'))
 def get_revenue():
     """Get revenue data"""
-    try:
-        # Get query parameters
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        destination_id = request.args.get('destination_id')
-        source_country_id = request.args.get('source_country_id')
-        limit = request.args.get('limit', 100, type=int)
-        
-        # Build query
-        query = Revenue.query
-        
-        if start_date:
-            query = query.filter(Revenue.date >= start_date)
-        if end_date:
-            query = query.filter(Revenue.date <= end_date)
-        if destination_id:
-            query = query.filter(Revenue.destination_id == destination_id)
-        if source_country_id:
-            query = query.filter(Revenue.source_country_id == source_country_id)
-        
-        # Execute query
-        revenue_data = query.order_by(Revenue.date.desc()).limit(limit).all()
-        
-        return jsonify({
-            'success': True,
-            'data': [revenue.to_dict() for revenue in revenue_data],
-            'count': len(revenue_data)
-        })
-        
-    except Exception as e:
-        logger.error(f"Error getting revenue data: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    query = db.session.query(*REVENUE_COLUMNS).join(
+        Destination, Revenue.destination_id == Destination.id
+    ).join(
+        TouristSource, Revenue.source_country_id == TouristSource.id
+    )
+    query = _filter_query(
+        query,
+        Revenue.date,
+        destination_id=Revenue.destination_id,
+        source_country_id=Revenue.source_country_id
+    )
+    
+    return _list_response(query.order_by(Revenue.date.desc()).limit(_request_limit()).all())
 
 @api_bp.route('/hotels', methods=['GET'])
+@cached_response('CATALOG_CACHE_TTL', params=('destination_id', 'category', 'limit'))
 def get_hotels():
     """Get hotel data"""
-    try:
-        # Get query parameters
-        destination_id = request.args.get('destination_id')
-        category = request.args.get('category')
-        limit = request.args.get('limit', 100, type=int)
-        
-        # Build query
-        query = Hotel.query.filter_by(is_active=True)
-        
-        if destination_id:
-            query = query.filter(Hotel.destination_id == destination_id)
-        if category:
-            query = query.filter(Hotel.category == category)
-        
-        # Execute query
-        hotels = query.limit(limit).all()
-        
-        return jsonify({
-            'success': True,
-            'data': [hotel.to_dict() for hotel in hotels],
-            'count': len(hotels)
-        })
-        
-    except Exception as e:
-        logger.error(f"Error getting hotel data: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    query = db.session.query(*HOTEL_COLUMNS).join(
+        Destination, Hotel.destination_id == Destination.id
+    ).filter(Hotel.is_active.is_(True))
+    query = _filter_query(query, destination_id=Hotel.destination_id, category=Hotel.category)
+    
+    return _list_response(query.limit(_request_limit()).all(), json_fields=('amenities', 'facilities'))
 
 @api_bp.route('/occupancy', methods=['GET'])
+@cached_response('TIME_SERIES_CACHE_TTL', params=('start_date', 'end_date', 'hotel_id', 'limit'))
 def get_occupancy():
     """Get occupancy data"""
-    try:
-        # Get query parameters
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        hotel_id = request.args.get('hotel_id')
-        limit = request.args.get('limit', 100, type=int)
-        
-        # Build query
-        query = Occupancy.query
-        
-        if start_date:
-            query = query.filter(Occupancy.date >= start_date)
-        if end_date:
-            query = query.filter(Occupancy.date <= end_date)
-        if hotel_id:
-            query = query.filter(Occupancy.hotel_id == hotel_id)
-        
-        # Execute query
-        occupancy_data = query.order_by(Occupancy.date.desc()).limit(limit).all()
-        
-        return jsonify({
-            'success': True,
-            'data': [occupancy.to_dict() for occupancy in occupancy_data],
-            'count': len(occupancy_data)
-        })
-        
-    except Exception as e:
-        logger.error(f"Error getting occupancy data: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    query = db.session.query(*OCCUPANCY_COLUMNS).join(
+        Hotel, Occupancy.hotel_id == Hotel.id
+    )
+    query = _filter_query(query, Occupancy.date, hotel_id=Occupancy.hotel_id)
+    
+    return _list_response(query.order_by(Occupancy.date.desc()).limit(_request_limit()).all())
 
 @api_bp.route('/destinations', methods=['GET'])
+@cached_response('CATALOG_CACHE_TTL', params=('category', 'province', 'limit'))
 def get_destinations():
     """Get destination data"""
-    try:
-        # Get query parameters
-        category = request.args.get('category')
-        province = request.args.get('province')
-        limit = request.args.get('limit', 100, type=int)
-        
-        # Build query
-        query = Destination.query.filter_by(is_active=True)
-        
-        if category:
-            query = query.filter(Destination.category == category)
-        if province:
-            query = query.filter(Destination.province == province)
-        
-        # Execute query
-        destinations = query.limit(limit).all()
-        
-        return jsonify({
-            'success': True,
-            'data': [destination.to_dict() for destination in destinations],
-            'count': len(destinations)
-        })
-        
-    except Exception as e:
-        logger.error(f"Error getting destination data: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    query = db.session.query(*DESTINATION_COLUMNS).filter(Destination.is_active.is_(True))
+    query = _filter_query(query, category=Destination.category, province=Destination.province)
+    
+    return _list_response(query.limit(_request_limit()).all(), json_fields=('features', 'activities'))
 
 @api_bp.route('/source-countries', methods=['GET'])
+@cached_response('CATALOG_CACHE_TTL', params=('region', 'limit'))
 def get_source_countries():
     """Get source country data"""
-    try:
-        # Get query parameters
-        region = request.args.get('region')
-        limit = request.args.get('limit', 100, type=int)
-        
-        # Build query
-        query = TouristSource.query.filter_by(is_active=True)
-        
-        if region:
-            query = query.filter(TouristSource.region == region)
-        
-        # Execute query
-        countries = query.limit(limit).all()
-        
-        return jsonify({
-            'success': True,
-            'data': [country.to_dict() for country in countries],
-            'count': len(countries)
-        })
-        
-    except Exception as e:
-        logger.error(f"Error getting source country data: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    query = db.session.query(*SOURCE_COUNTRY_COLUMNS).filter(TouristSource.is_active.is_(True))
+    query = _filter_query(query, region=TouristSource.region)
+    
+    return _list_response(query.limit(_request_limit()).all())
 
 @api_bp.route('/analytics/summary', methods=['GET'])
+@cached_response('ANALYTICS_CACHE_TTL', params=('start_date', 'end_date'))
 def get_analytics_summary():
     """Get analytics summary"""
-    try:
-        # Get query parameters
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        
-        # Calculate summary statistics
-        arrivals_query = TouristArrival.query
-        revenue_query = Revenue.query
-        occupancy_query = Occupancy.query
-        
-        if start_date:
-            arrivals_query = arrivals_query.filter(TouristArrival.date >= start_date)
-            revenue_query = revenue_query.filter(Revenue.date >= start_date)
-            occupancy_query = occupancy_query.filter(Occupancy.date >= start_date)
-        
-        if end_date:
-            arrivals_query = arrivals_query.filter(TouristArrival.date <= end_date)
-            revenue_query = revenue_query.filter(Revenue.date <= end_date)
-            occupancy_query = occupancy_query.filter(Occupancy.date <= end_date)
-        
-        # Get totals
-        total_arrivals = arrivals_query.with_entities(
-            db.func.sum(TouristArrival.total_arrivals)
-        ).scalar() or 0
-        
-        total_revenue = revenue_query.with_entities(
-            db.func.sum(Revenue.revenue_usd)
-        ).scalar() or 0
-        
-        avg_occupancy = occupancy_query.with_entities(
-            db.func.avg(Occupancy.occupancy_rate)
-        ).scalar() or 0
-        
-        # Get top destinations
-        top_destinations = db.session.query(
-            Destination.name,
-            db.func.sum(TouristArrival.total_arrivals).label('total_arrivals')
-        ).join(TouristArrival).group_by(Destination.name).order_by(
-            db.func.sum(TouristArrival.total_arrivals).desc()
-        ).limit(5).all()
-        
-        # Get top source countries
-        top_countries = db.session.query(
-            TouristSource.name,
-            db.func.sum(TouristArrival.total_arrivals).label('total_arrivals')
-        ).join(TouristArrival).group_by(TouristSource.name).order_by(
-            db.func.sum(TouristArrival.total_arrivals).desc()
-        ).limit(5).all()
-        
-        return jsonify({
-            'success': True,
-            'data': {
-                'total_arrivals': total_arrivals,
-                'total_revenue_usd': total_revenue,
-                'average_occupancy_rate': avg_occupancy,
-                'top_destinations': [
-                    {'name': d.name, 'arrivals': d.total_arrivals} 
-                    for d in top_destinations
-                ],
-                'top_source_countries': [
-                    {'name': c.name, 'arrivals': c.total_arrivals} 
-                    for c in top_countries
-                ]
-            }
-        })
-        
-    except Exception as e:
-        logger.error(f"Error getting analytics summary: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    # Get query parameters
+    start_date, end_before = _parse_date_range(request.args)
+    
+    # Arrivals and revenue come from the daily rollup instead of the fact tables
+    rollup_filters = []
+    occupancy_filters = []
+    
+    if start_date:
+        rollup_filters.append(DailyArrivalRollup.date >= start_date)
+        occupancy_filters.append(Occupancy.date >= start_date)
+    
+    if end_before:
+        rollup_filters.append(DailyArrivalRollup.date < end_before)
+        occupancy_filters.append(Occupancy.date < end_before)
+    
+    totals = select(
+        db.func.sum(DailyArrivalRollup.total_arrivals).label('total_arrivals'),
+        db.func.sum(DailyArrivalRollup.revenue_usd).label('total_revenue')
+    ).where(*rollup_filters).subquery()
+    
+    avg_occupancy = select(
+        db.func.avg(Occupancy.occupancy_rate)
+    ).where(*occupancy_filters).scalar_subquery()
+    
+    # Fetch every figure in a single round trip
+    summary = db.session.execute(
+        select(
+            totals.c.total_arrivals,
+            totals.c.total_revenue,
+            avg_occupancy.label('average_occupancy_rate'),
+            _top_arrivals_json(Destination, DailyArrivalRollup.destination_id).label('top_destinations'),
+            _top_arrivals_json(TouristSource, DailyArrivalRollup.source_country_id).label('top_source_countries')
+        )
+    ).one()
+    
+    return jsonify({
+        'success': True,
+        'data': {
+            'total_arrivals': summary.total_arrivals or 0,
+            'total_revenue_usd': summary.total_revenue or 0,
+            'average_occupancy_rate': summary.average_occupancy_rate or 0,
+            'top_destinations': summary.top_destinations,
+            'top_source_countries': summary.top_source_countries
+        }
+    })
 
 @api_bp.route('/data/collect', methods=['POST'])
+@rate_limited('DATA_COLLECT_RATE_LIMIT', 'DATA_COLLECT_RATE_WINDOW')
 def collect_data():
     """Trigger data collection"""
+    # Parse the body once; only an absent or empty body means defaults
+    body = request.get_data(cache=False)
     try:
-        data_type = request.json.get('data_type', 'all')
-        start_date = request.json.get('start_date')
-        end_date = request.json.get('end_date')
-        
-        collector = DataCollector()
-        
-        if data_type == 'arrivals':
-            count = collector.collect_tourist_arrivals(start_date, end_date)
-        elif data_type == 'hotels':
-            count = collector.collect_hotel_data()
-        elif data_type == 'revenue':
-            count = collector.collect_revenue_data(start_date, end_date)
-        elif data_type == 'weather':
-            count = collector.collect_weather_data()
-        else:  # all
-            count = (
-                collector.collect_tourist_arrivals(start_date, end_date) +
-                collector.collect_hotel_data() +
-                collector.collect_revenue_data(start_date, end_date) +
-                collector.collect_weather_data()
-            )
-        
-        return jsonify({
-            'success': True,
-            'message': f'Collected {count} records',
-            'data_type': data_type
-        })
-        
-    except Exception as e:
-        logger.error(f"Error collecting data: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
\ No newline at end of file
+        data = orjson.loads(body) if body.strip() else {}
+    except orjson.JSONDecodeError:
+        raise APIError('Invalid JSON body')
+    if not isinstance(data, dict):
+        raise APIError('Request body must be a JSON object')
+    
+    data_type = data.get('data_type', 'all')
+    if not isinstance(data_type, str):
+        raise APIError('data_type must be a string')
+    start_date = data.get('start_date')
+    end_date = data.get('end_date')
+    
+    if data_type != 'all' and data_type not in DATA_COLLECTORS:
+        raise APIError(f'Unsupported data_type: {data_type}')
+    
+    collector = _get_collector()
+    if data_type == 'all':
+        count = collector.collect_all_data(start_date, end_date)
+    else:
+        count = DATA_COLLECTORS[data_type](collector, start_date, end_date)
+    _invalidate_response_cache()
+    
+    return jsonify({
+        'success': True,
+        'message': f'Collected {count} records',
+        'data_type': data_type
+    })
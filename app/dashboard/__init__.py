@@ -228,7 +228,7 @@ def register_callbacks(dash_app):
             
             return destination_options, country_options
         except Exception as e:
-            logger.error(f"Error updating dropdown options: {str(e)}")
+            logger.error("Error updating dropdown options: %s", e)
             return [], []
     
     @dash_app.callback(
@@ -300,7 +300,7 @@ def register_callbacks(dash_app):
             )
             
         except Exception as e:
-            logger.error(f"Error updating metrics: {str(e)}")
+            logger.error("Error updating metrics: %s", e)
             return "0", "$0", "0.0%", "N/A"
     
     @dash_app.callback(
@@ -347,7 +347,7 @@ def register_callbacks(dash_app):
             return fig
             
         except Exception as e:
-            logger.error(f"Error updating arrivals trend: {str(e)}")
+            logger.error("Error updating arrivals trend: %s", e)
             return px.line(title='Tourist Arrivals Trend')
     
     @dash_app.callback(
@@ -395,7 +395,7 @@ def register_callbacks(dash_app):
             return fig
             
         except Exception as e:
-            logger.error(f"Error updating revenue breakdown: {str(e)}")
+            logger.error("Error updating revenue breakdown: %s", e)
             return px.pie(title='Revenue Breakdown by Category')
     
     @dash_app.callback(
@@ -441,7 +441,7 @@ def register_callbacks(dash_app):
             return fig
             
         except Exception as e:
-            logger.error(f"Error updating source countries: {str(e)}")
+            logger.error("Error updating source countries: %s", e)
             return px.bar(title='Top 10 Source Countries')
     
     @dash_app.callback(
@@ -487,7 +487,7 @@ def register_callbacks(dash_app):
             return fig
             
         except Exception as e:
-            logger.error(f"Error updating destinations: {str(e)}")
+            logger.error("Error updating destinations: %s", e)
             return px.bar(title='Top 10 Popular Destinations')
     
     @dash_app.callback(
@@ -528,7 +528,7 @@ def register_callbacks(dash_app):
             return fig
             
         except Exception as e:
-            logger.error(f"Error updating occupancy trend: {str(e)}")
+            logger.error("Error updating occupancy trend: %s", e)
             return px.line(title='Average Hotel Occupancy Rate Trend')
     
     @dash_app.callback(
@@ -589,7 +589,7 @@ def register_callbacks(dash_app):
             return dbc.Table(table_header + table_body, bordered=True, hover=True)
             
         except Exception as e:
-            logger.error(f"Error updating arrivals table: {str(e)}")
+            logger.error("Error updating arrivals table: %s", e)
             return html.P("Error loading data", className="text-danger")
 
 # Create blueprint for Flask
@@ -0,0 +1,20 @@
+from flask.json.provider import DefaultJSONProvider
+import orjson
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes responses with orjson"""
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string"""
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+
+        # Types orjson cannot handle (e.g. Decimal) fall back to Flask's default
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes"""
+        return orjson.loads(s)
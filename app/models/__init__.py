@@ -1,4 +1,4 @@
-from .tourist_data import TouristArrival, TouristSource, Destination
+from .tourist_data import TouristArrival, TouristSource, Destination, DailyArrivalRollup
 from .accommodation import Hotel, Booking, Occupancy
 from .sentiment import SocialMediaPost, SentimentAnalysis
 from .revenue import Revenue, RevenueSource
@@ -7,6 +7,7 @@ __all__ = [
     'TouristArrival',
     'TouristSource', 
     'Destination',
+    'DailyArrivalRollup',
     'Hotel',
     'Booking',
     'Occupancy',
@@ -162,6 +162,9 @@ class Occupancy(db.Model):
     """Model for hotel occupancy data"""
     
     __tablename__ = 'occupancy'
+    __table_args__ = (
+        db.Index('ix_occupancy_hotel_date', 'hotel_id', 'date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     hotel_id = db.Column(db.Integer, db.ForeignKey('hotels.id'), nullable=False)
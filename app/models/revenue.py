@@ -6,6 +6,10 @@ class Revenue(db.Model):
     """Model for tourism revenue data"""
     
     __tablename__ = 'revenue'
+    __table_args__ = (
+        db.Index('ix_revenue_destination_date', 'destination_id', 'date'),
+        db.Index('ix_revenue_source_country_date', 'source_country_id', 'date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     date = db.Column(db.Date, nullable=False, index=True)
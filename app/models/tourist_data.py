@@ -6,6 +6,11 @@ class TouristArrival(db.Model):
     """Model for tourist arrival data"""
     
     __tablename__ = 'tourist_arrivals'
+    __table_args__ = (
+        # Match the list filters; scanned backwards to serve the date DESC sort and limit
+        db.Index('ix_tourist_arrivals_destination_date', 'destination_id', 'date'),
+        db.Index('ix_tourist_arrivals_source_country_date', 'source_country_id', 'date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     date = db.Column(db.Date, nullable=False, index=True)
@@ -166,4 +171,22 @@ class Destination(db.Model):
         }
     
     def __repr__(self):
-        return f'<Destination {self.name} ({self.category})>'
\ No newline at end of file
+        return f'<Destination {self.name} ({self.category})>'
+
+class DailyArrivalRollup(db.Model):
+    """Model for daily arrivals and revenue per destination and source country"""
+    
+    __tablename__ = 'daily_arrival_rollup'
+    
+    # Derived from tourist_arrivals and revenue; rebuilt by DataCollector on ingest.
+    # Created by migration 57167cf944f6; backfill it on deploy with `flask backfill-arrival-rollup`
+    date = db.Column(db.Date, primary_key=True)
+    destination_id = db.Column(db.Integer, db.ForeignKey('destinations.id'), primary_key=True)
+    source_country_id = db.Column(db.Integer, db.ForeignKey('tourist_sources.id'), primary_key=True)
+    
+    # Aggregates
+    total_arrivals = db.Column(db.Integer, nullable=False, default=0)
+    revenue_usd = db.Column(db.Float, nullable=False, default=0.0)
+    
+    def __repr__(self):
+        return f'<DailyArrivalRollup {self.date}: {self.total_arrivals} arrivals, {self.revenue_usd} USD>'
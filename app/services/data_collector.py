@@ -1,15 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import random
 import logging
+from sqlalchemy import delete, insert, literal, select, union_all
 from app import db
-from app.models import TouristArrival, TouristSource, Destination, Hotel, Booking, Occupancy, Revenue
+from app.models import TouristArrival, TouristSource, Destination, DailyArrivalRollup, Hotel, Booking, Occupancy, Revenue
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Transaction-scoped advisory lock serializing daily_arrival_rollup rebuilds
+ARRIVAL_ROLLUP_LOCK_KEY = 0x524f4c4c
+
 class DataCollector:
     """Service for collecting tourism data from various sources"""
     
@@ -17,13 +24,22 @@ class DataCollector:
         self.config = Config()
         self.session = requests.Session()
         
-    def collect_tourist_arrivals(self, start_date=None, end_date=None):
+        # Reuse keep-alive connections and retry transient upstream failures with backoff
+        retry = Retry(
+            total=self.config.EXTERNAL_API_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET',),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+    def collect_tourist_arrivals(self, start_date=None, end_date=None, refresh_rollup=True):
         """Collect tourist arrival data"""
         try:
-            if not start_date:
-                start_date = datetime.now() - timedelta(days=30)
-            if not end_date:
-                end_date = datetime.now()
+            start_date, end_date = self._collection_window(start_date, end_date)
             
             # In a real implementation, this would fetch from SLTDA API or airport data
             # For now, we'll generate simulated data
@@ -32,14 +48,34 @@ class DataCollector:
             # Save to database
             for arrival in arrivals_data:
                 self._save_tourist_arrival(arrival)
+            if refresh_rollup:
+                self._rebuild_arrival_rollup(start_date, end_date)
+            db.session.commit()
             
-            logger.info(f"Collected {len(arrivals_data)} tourist arrival records")
+            logger.info("Collected %s tourist arrival records", len(arrivals_data))
             return len(arrivals_data)
             
         except Exception as e:
-            logger.error(f"Error collecting tourist arrivals: {str(e)}")
+            db.session.rollback()
+            logger.error("Error collecting tourist arrivals: %s", e)
             return 0
     
+    def collect_all_data(self, start_date=None, end_date=None):
+        """Run every collector, rebuilding the arrival rollup once for both fact tables"""
+        start_date, end_date = self._collection_window(start_date, end_date)
+        
+        count = self.collect_tourist_arrivals(start_date, end_date, refresh_rollup=False)
+        count += self.collect_hotel_data()
+        count += self.collect_revenue_data(start_date, end_date, refresh_rollup=False)
+        count += self.collect_weather_data()
+        self.refresh_arrival_rollup(start_date, end_date)
+        return count
+    
+    def _collection_window(self, start_date, end_date):
+        """Default a collection window to the last 30 days"""
+        now = datetime.now()
+        return start_date or now - timedelta(days=30), end_date or now
+    
     def collect_hotel_data(self):
         """Collect hotel booking and occupancy data"""
         try:
@@ -57,21 +93,20 @@ class DataCollector:
             
             for occupancy in occupancy_data:
                 self._save_occupancy(occupancy)
+            db.session.commit()
             
-            logger.info(f"Collected hotel data: {len(hotels_data)} hotels, {len(bookings_data)} bookings, {len(occupancy_data)} occupancy records")
+            logger.info("Collected hotel data: %s hotels, %s bookings, %s occupancy records", len(hotels_data), len(bookings_data), len(occupancy_data))
             return len(hotels_data) + len(bookings_data) + len(occupancy_data)
             
         except Exception as e:
-            logger.error(f"Error collecting hotel data: {str(e)}")
+            db.session.rollback()
+            logger.error("Error collecting hotel data: %s", e)
             return 0
     
-    def collect_revenue_data(self, start_date=None, end_date=None):
+    def collect_revenue_data(self, start_date=None, end_date=None, refresh_rollup=True):
         """Collect revenue data"""
         try:
-            if not start_date:
-                start_date = datetime.now() - timedelta(days=30)
-            if not end_date:
-                end_date = datetime.now()
+            start_date, end_date = self._collection_window(start_date, end_date)
             
             # Generate simulated revenue data
             revenue_data = self._generate_simulated_revenue(start_date, end_date)
@@ -79,12 +114,16 @@ class DataCollector:
             # Save to database
             for revenue in revenue_data:
                 self._save_revenue(revenue)
+            if refresh_rollup:
+                self._rebuild_arrival_rollup(start_date, end_date)
+            db.session.commit()
             
-            logger.info(f"Collected {len(revenue_data)} revenue records")
+            logger.info("Collected %s revenue records", len(revenue_data))
             return len(revenue_data)
             
         except Exception as e:
-            logger.error(f"Error collecting revenue data: {str(e)}")
+            db.session.rollback()
+            logger.error("Error collecting revenue data: %s", e)
             return 0
     
     def collect_weather_data(self):
@@ -103,38 +142,116 @@ class DataCollector:
                 {'name': 'Trincomalee', 'lat': 8.5711, 'lon': 81.2335}
             ]
             
-            weather_data = []
-            for city in cities:
-                url = f"http://api.openweathermap.org/data/2.5/weather"
-                params = {
-                    'lat': city['lat'],
-                    'lon': city['lon'],
-                    'appid': self.config.OPENWEATHER_API_KEY,
-                    'units': 'metric'
-                }
-                
-                response = self.session.get(url, params=params)
-                if response.status_code == 200:
-                    data = response.json()
-                    weather_data.append({
-                        'city': city['name'],
-                        'temperature': data['main']['temp'],
-                        'humidity': data['main']['humidity'],
-                        'description': data['weather'][0]['description'],
-                        'timestamp': datetime.now()
-                    })
+            # Cities are fetched concurrently; the pooled session keeps a connection per worker
+            with ThreadPoolExecutor(max_workers=self.config.EXTERNAL_API_WORKERS) as executor:
+                results = executor.map(self._fetch_city_weather, cities)
+                weather_data = [item for item in results if item]
             
             # Store weather data in Redis for caching
             from app import redis_client
             redis_client.setex('weather_data', 3600, str(weather_data))  # Cache for 1 hour
             
-            logger.info(f"Collected weather data for {len(weather_data)} cities")
+            logger.info("Collected weather data for %s cities", len(weather_data))
             return len(weather_data)
             
         except Exception as e:
-            logger.error(f"Error collecting weather data: {str(e)}")
+            logger.error("Error collecting weather data: %s", e)
             return 0
     
+    def _fetch_city_weather(self, city):
+        """Fetch current weather for one city, or None if the request or its payload is unusable"""
+        url = f"http://api.openweathermap.org/data/2.5/weather"
+        params = {
+            'lat': city['lat'],
+            'lon': city['lon'],
+            'appid': self.config.OPENWEATHER_API_KEY,
+            'units': 'metric'
+        }
+        
+        # One unreachable city or malformed payload must not discard the others' results
+        try:
+            response = self.session.get(url, params=params, timeout=self.config.EXTERNAL_API_TIMEOUT)
+            if response.status_code != 200:
+                return None
+            
+            data = response.json()
+            return {
+                'city': city['name'],
+                'temperature': data['main']['temp'],
+                'humidity': data['main']['humidity'],
+                'description': data['weather'][0]['description'],
+                'timestamp': datetime.now()
+            }
+        except (requests.RequestException, ValueError, KeyError, IndexError, TypeError) as e:
+            logger.warning("Error fetching weather for %s: %s", city['name'], e)
+            return None
+    
+    def refresh_arrival_rollup(self, start_date=None, end_date=None):
+        """Rebuild the daily arrival rollup for a date range, or for all dates"""
+        try:
+            self._rebuild_arrival_rollup(start_date, end_date)
+            db.session.commit()
+            
+            logger.info("Refreshed daily arrival rollup from %s to %s", start_date, end_date)
+            return True
+            
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error refreshing daily arrival rollup: %s", e)
+            return False
+    
+    def _rebuild_arrival_rollup(self, start_date, end_date):
+        """Replace rollup rows in a date range with fresh aggregates of the fact tables"""
+        # Pending fact rows must be visible to the INSERT ... SELECT below
+        db.session.flush()
+        
+        # Overlapping rebuilds would otherwise both delete the range and then
+        # collide on the primary key when inserting; held until commit or rollback
+        db.session.execute(select(db.func.pg_advisory_xact_lock(ARRIVAL_ROLLUP_LOCK_KEY)))
+        
+        arrivals = select(
+            TouristArrival.date,
+            TouristArrival.destination_id,
+            TouristArrival.source_country_id,
+            TouristArrival.total_arrivals.label('total_arrivals'),
+            literal(0.0).label('revenue_usd')
+        )
+        revenue = select(
+            Revenue.date,
+            Revenue.destination_id,
+            Revenue.source_country_id,
+            literal(0).label('total_arrivals'),
+            db.func.coalesce(Revenue.revenue_usd, 0.0).label('revenue_usd')
+        )
+        stale = delete(DailyArrivalRollup)
+        
+        # Whole days, so a default window ending now still covers today
+        if start_date:
+            start_day = start_date.date() if isinstance(start_date, datetime) else start_date
+            arrivals = arrivals.where(TouristArrival.date >= start_day)
+            revenue = revenue.where(Revenue.date >= start_day)
+            stale = stale.where(DailyArrivalRollup.date >= start_day)
+        if end_date:
+            end_day = end_date.date() if isinstance(end_date, datetime) else end_date
+            arrivals = arrivals.where(TouristArrival.date <= end_day)
+            revenue = revenue.where(Revenue.date <= end_day)
+            stale = stale.where(DailyArrivalRollup.date <= end_day)
+        
+        combined = union_all(arrivals, revenue).subquery()
+        group_columns = (combined.c.date, combined.c.destination_id, combined.c.source_country_id)
+        
+        db.session.execute(stale)
+        db.session.execute(
+            insert(DailyArrivalRollup).from_select(
+                ['date', 'destination_id', 'source_country_id', 'total_arrivals', 'revenue_usd'],
+                select(
+                    *group_columns,
+                    db.func.sum(combined.c.total_arrivals),
+                    db.func.sum(combined.c.revenue_usd)
+                ).group_by(*group_columns)
+            )
+        )
+    
     def _generate_simulated_arrivals(self, start_date, end_date):
         """Generate simulated tourist arrival data"""
         arrivals = []
@@ -218,8 +335,9 @@ class DataCollector:
     def _generate_simulated_bookings(self):
         """Generate simulated booking data"""
         bookings = []
-        start_date = datetime.now() - timedelta(days=30)
-        end_date = datetime.now() + timedelta(days=90)
+        now = datetime.now()
+        start_date = now - timedelta(days=30)
+        end_date = now + timedelta(days=90)
         
         # Generate bookings for the next 3 months
         current_date = start_date
@@ -253,8 +371,9 @@ class DataCollector:
     def _generate_simulated_occupancy(self):
         """Generate simulated occupancy data"""
         occupancy = []
-        start_date = datetime.now() - timedelta(days=30)
-        end_date = datetime.now()
+        now = datetime.now()
+        start_date = now - timedelta(days=30)
+        end_date = now
         
         current_date = start_date
         while current_date <= end_date:
@@ -362,11 +481,10 @@ class DataCollector:
             )
             
             db.session.add(arrival)
-            db.session.commit()
             
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error saving tourist arrival: {str(e)}")
+            logger.error("Error saving tourist arrival: %s", e)
+            raise
     
     def _save_hotel(self, hotel_data):
         """Save hotel data to database"""
@@ -408,11 +526,10 @@ class DataCollector:
             )
             
             db.session.add(hotel)
-            db.session.commit()
             
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error saving hotel: {str(e)}")
+            logger.error("Error saving hotel: %s", e)
+            raise
     
     def _save_booking(self, booking_data):
         """Save booking data to database"""
@@ -433,11 +550,10 @@ class DataCollector:
             )
             
             db.session.add(booking)
-            db.session.commit()
             
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error saving booking: {str(e)}")
+            logger.error("Error saving booking: %s", e)
+            raise
     
     def _save_occupancy(self, occupancy_data):
         """Save occupancy data to database"""
@@ -457,11 +573,10 @@ class DataCollector:
             )
             
             db.session.add(occupancy)
-            db.session.commit()
             
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error saving occupancy: {str(e)}")
+            logger.error("Error saving occupancy: %s", e)
+            raise
     
     def _save_revenue(self, revenue_data):
         """Save revenue data to database"""
@@ -496,8 +611,7 @@ class DataCollector:
             revenue.calculate_revenue_usd()
             
             db.session.add(revenue)
-            db.session.commit()
             
         except Exception as e:
-            db.session.rollback()
-            logger.error(f"Error saving revenue: {str(e)}")
\ No newline at end of file
+            logger.error("Error saving revenue: %s", e)
+            raise
\ No newline at end of file
@@ -1,6 +1,9 @@
 import logging
 from textblob import TextBlob
 import re
+import hashlib
+import json
+import redis
 from datetime import datetime
 from app import db
 from app.models import SocialMediaPost, SentimentAnalysis
@@ -8,6 +11,45 @@ from config import Config
 
 logger = logging.getLogger(__name__)
 
+# Text cleaning patterns
+URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+MENTION_PATTERN = re.compile(r'@\w+')
+HASHTAG_PATTERN = re.compile(r'#(\w+)')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s\.\,\!\?\-]')
+
+# Tourism-related topics
+TOURISM_TOPICS = {
+    'accommodation': ('hotel', 'resort', 'guesthouse', 'villa', 'room', 'stay', 'accommodation'),
+    'food': ('restaurant', 'food', 'cuisine', 'meal', 'dining', 'breakfast', 'lunch', 'dinner'),
+    'transportation': ('transport', 'bus', 'train', 'taxi', 'car', 'airport', 'travel'),
+    'attractions': ('temple', 'beach', 'museum', 'park', 'garden', 'fort', 'palace', 'ruins'),
+    'activities': ('sightseeing', 'tour', 'hiking', 'swimming', 'shopping', 'spa', 'massage'),
+    'culture': ('culture', 'traditional', 'heritage', 'history', 'art', 'music', 'dance'),
+    'nature': ('nature', 'wildlife', 'forest', 'mountain', 'ocean', 'river', 'waterfall'),
+    'weather': ('weather', 'climate', 'sunny', 'rainy', 'hot', 'cold', 'temperature')
+}
+
+# Simple emotion detection keywords
+EMOTION_KEYWORDS = {
+    'joy': ('happy', 'excited', 'amazing', 'wonderful', 'fantastic', 'great', 'love', 'enjoy'),
+    'sadness': ('sad', 'disappointed', 'terrible', 'awful', 'bad', 'hate', 'dislike'),
+    'anger': ('angry', 'furious', 'mad', 'annoyed', 'frustrated', 'upset'),
+    'fear': ('scared', 'afraid', 'worried', 'anxious', 'nervous', 'terrified'),
+    'surprise': ('surprised', 'shocked', 'amazed', 'astonished', 'unexpected'),
+    'disgust': ('disgusting', 'gross', 'nasty', 'revolting', 'sickening')
+}
+
+# Keywords marking a post as tourism-related
+TOURISM_KEYWORDS = (
+    'sri lanka', 'colombo', 'kandy', 'galle', 'sigiriya', 'anuradhapura',
+    'tourism', 'tourist', 'travel', 'vacation', 'holiday', 'trip',
+    'hotel', 'resort', 'guesthouse', 'accommodation', 'booking',
+    'beach', 'temple', 'culture', 'heritage', 'nature', 'wildlife',
+    'food', 'cuisine', 'restaurant', 'transport', 'airport',
+    'visit', 'explore', 'discover', 'experience', 'adventure'
+)
+
 class SentimentAnalyzer:
     """Service for analyzing sentiment in social media posts"""
     
@@ -20,6 +62,12 @@ class SentimentAnalyzer:
             # Clean text
             cleaned_text = self._clean_text(post_text)
             
+            # Reposts and retweets repeat the same text; reuse earlier results
+            cache_key = self._cache_key(cleaned_text, language)
+            cached_result = self._get_cached_result(cache_key)
+            if cached_result is not None:
+                return cached_result
+            
             # Create TextBlob object
             blob = TextBlob(cleaned_text)
             
@@ -47,7 +95,7 @@ class SentimentAnalyzer:
                 neutral_score = 1
             
             # Extract keywords
-            keywords = self._extract_keywords(cleaned_text)
+            keywords = self._extract_keywords(blob)
             
             # Extract topics
             topics = self._extract_topics(cleaned_text)
@@ -55,7 +103,7 @@ class SentimentAnalyzer:
             # Detect emotions
             emotions = self._detect_emotions(cleaned_text)
             
-            return {
+            result = {
                 'positive_score': positive_score,
                 'negative_score': negative_score,
                 'neutral_score': neutral_score,
@@ -70,10 +118,39 @@ class SentimentAnalyzer:
                 'processing_version': '0.17.1'
             }
             
+            self._cache_result(cache_key, result)
+            return result
+            
         except Exception as e:
-            logger.error(f"Error analyzing sentiment: {str(e)}")
+            logger.error("Error analyzing sentiment: %s", e)
             return None
     
+    def _cache_key(self, cleaned_text, language):
+        """Build the Redis key for a cleaned text's analysis"""
+        digest = hashlib.sha1(cleaned_text.encode('utf-8')).hexdigest()
+        return f"sentiment:{language}:{digest}"
+    
+    def _get_cached_result(self, cache_key):
+        """Get a cached analysis result, or None on a miss"""
+        from app import redis_client
+        
+        try:
+            cached = redis_client.get(cache_key)
+        except (AttributeError, redis.RedisError) as e:
+            logger.warning("Sentiment cache unavailable: %s", e)
+            return None
+        
+        return json.loads(cached) if cached else None
+    
+    def _cache_result(self, cache_key, result):
+        """Store an analysis result in the cache"""
+        from app import redis_client
+        
+        try:
+            redis_client.setex(cache_key, self.config.SENTIMENT_CACHE_TTL, json.dumps(result))
+        except (AttributeError, redis.RedisError) as e:
+            logger.warning("Sentiment cache unavailable: %s", e)
+    
     def analyze_batch_sentiment(self, posts):
         """Analyze sentiment for multiple posts"""
         results = []
@@ -112,22 +189,31 @@ class SentimentAnalyzer:
                     results.append(sentiment_analysis)
                 
             except Exception as e:
-                logger.error(f"Error analyzing sentiment for post {post.id}: {str(e)}")
+                logger.error("Error analyzing sentiment for post %s: %s", post.id, e)
                 continue
         
         try:
             db.session.commit()
-            logger.info(f"Analyzed sentiment for {len(results)} posts")
+            logger.info("Analyzed sentiment for %s posts", len(results))
         except Exception as e:
             db.session.rollback()
-            logger.error(f"Error saving sentiment analysis: {str(e)}")
+            logger.error("Error saving sentiment analysis: %s", e)
         
         return results
     
     def get_sentiment_summary(self, start_date=None, end_date=None, platform=None):
         """Get sentiment summary statistics"""
         try:
-            query = db.session.query(SentimentAnalysis).join(SocialMediaPost)
+            # One grouped scan yields both the distribution and the score averages
+            query = db.session.query(
+                SentimentAnalysis.sentiment_label,
+                db.func.count(SentimentAnalysis.id).label('count'),
+                db.func.sum(SentimentAnalysis.positive_score).label('sum_positive'),
+                db.func.sum(SentimentAnalysis.negative_score).label('sum_negative'),
+                db.func.sum(SentimentAnalysis.neutral_score).label('sum_neutral'),
+                db.func.sum(SentimentAnalysis.confidence_score).label('sum_confidence'),
+                db.func.count(SentimentAnalysis.confidence_score).label('confidence_count')
+            ).join(SocialMediaPost)
             
             if start_date:
                 query = query.filter(SocialMediaPost.posted_at >= start_date)
@@ -136,21 +222,15 @@ class SentimentAnalyzer:
             if platform:
                 query = query.filter(SocialMediaPost.platform == platform)
             
-            # Get sentiment distribution
-            sentiment_distribution = db.session.query(
-                SentimentAnalysis.sentiment_label,
-                db.func.count(SentimentAnalysis.id).label('count')
-            ).join(SocialMediaPost).filter(query.whereclause).group_by(
-                SentimentAnalysis.sentiment_label
-            ).all()
+            sentiment_distribution = query.group_by(SentimentAnalysis.sentiment_label).all()
+            
+            # Combine per-label sums into overall averages (confidence may be NULL)
+            total_posts = sum(item.count for item in sentiment_distribution)
+            confidence_count = sum(item.confidence_count for item in sentiment_distribution)
             
-            # Get average sentiment scores
-            avg_scores = db.session.query(
-                db.func.avg(SentimentAnalysis.positive_score).label('avg_positive'),
-                db.func.avg(SentimentAnalysis.negative_score).label('avg_negative'),
-                db.func.avg(SentimentAnalysis.neutral_score).label('avg_neutral'),
-                db.func.avg(SentimentAnalysis.confidence_score).label('avg_confidence')
-            ).join(SocialMediaPost).filter(query.whereclause).first()
+            def average(column, count):
+                total = sum(getattr(item, column) or 0 for item in sentiment_distribution)
+                return total / count if count else 0
             
             # Get top keywords
             # This would require more complex querying or post-processing
@@ -161,16 +241,16 @@ class SentimentAnalyzer:
                     for item in sentiment_distribution
                 },
                 'average_scores': {
-                    'positive': avg_scores.avg_positive or 0,
-                    'negative': avg_scores.avg_negative or 0,
-                    'neutral': avg_scores.avg_neutral or 0,
-                    'confidence': avg_scores.avg_confidence or 0
+                    'positive': average('sum_positive', total_posts),
+                    'negative': average('sum_negative', total_posts),
+                    'neutral': average('sum_neutral', total_posts),
+                    'confidence': average('sum_confidence', confidence_count)
                 },
-                'total_posts': sum(item.count for item in sentiment_distribution)
+                'total_posts': total_posts
             }
             
         except Exception as e:
-            logger.error(f"Error getting sentiment summary: {str(e)}")
+            logger.error("Error getting sentiment summary: %s", e)
             return None
     
     def _clean_text(self, text):
@@ -179,27 +259,25 @@ class SentimentAnalyzer:
             return ""
         
         # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+        text = URL_PATTERN.sub('', text)
         
         # Remove mentions
-        text = re.sub(r'@\w+', '', text)
+        text = MENTION_PATTERN.sub('', text)
         
         # Remove hashtags but keep the text
-        text = re.sub(r'#(\w+)', r'\1', text)
+        text = HASHTAG_PATTERN.sub(r'\1', text)
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_PATTERN.sub(' ', text)
         
         # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s\.\,\!\?\-]', '', text)
+        text = SPECIAL_CHARS_PATTERN.sub('', text)
         
         return text.strip()
     
-    def _extract_keywords(self, text):
-        """Extract keywords from text"""
+    def _extract_keywords(self, blob):
+        """Extract keywords from an already parsed TextBlob"""
         try:
-            blob = TextBlob(text)
-            
             # Get noun phrases and words
             keywords = []
             
@@ -217,54 +295,32 @@ class SentimentAnalyzer:
             return keywords
             
         except Exception as e:
-            logger.error(f"Error extracting keywords: {str(e)}")
+            logger.error("Error extracting keywords: %s", e)
             return []
     
     def _extract_topics(self, text):
         """Extract topics from text"""
         try:
-            # Define tourism-related topics
-            tourism_topics = {
-                'accommodation': ['hotel', 'resort', 'guesthouse', 'villa', 'room', 'stay', 'accommodation'],
-                'food': ['restaurant', 'food', 'cuisine', 'meal', 'dining', 'breakfast', 'lunch', 'dinner'],
-                'transportation': ['transport', 'bus', 'train', 'taxi', 'car', 'airport', 'travel'],
-                'attractions': ['temple', 'beach', 'museum', 'park', 'garden', 'fort', 'palace', 'ruins'],
-                'activities': ['sightseeing', 'tour', 'hiking', 'swimming', 'shopping', 'spa', 'massage'],
-                'culture': ['culture', 'traditional', 'heritage', 'history', 'art', 'music', 'dance'],
-                'nature': ['nature', 'wildlife', 'forest', 'mountain', 'ocean', 'river', 'waterfall'],
-                'weather': ['weather', 'climate', 'sunny', 'rainy', 'hot', 'cold', 'temperature']
-            }
-            
             text_lower = text.lower()
             detected_topics = []
             
-            for topic, keywords in tourism_topics.items():
+            for topic, keywords in TOURISM_TOPICS.items():
                 if any(keyword in text_lower for keyword in keywords):
                     detected_topics.append(topic)
             
             return detected_topics
             
         except Exception as e:
-            logger.error(f"Error extracting topics: {str(e)}")
+            logger.error("Error extracting topics: %s", e)
             return []
     
     def _detect_emotions(self, text):
         """Detect emotions in text"""
         try:
-            # Simple emotion detection based on keywords
-            emotion_keywords = {
-                'joy': ['happy', 'excited', 'amazing', 'wonderful', 'fantastic', 'great', 'love', 'enjoy'],
-                'sadness': ['sad', 'disappointed', 'terrible', 'awful', 'bad', 'hate', 'dislike'],
-                'anger': ['angry', 'furious', 'mad', 'annoyed', 'frustrated', 'upset'],
-                'fear': ['scared', 'afraid', 'worried', 'anxious', 'nervous', 'terrified'],
-                'surprise': ['surprised', 'shocked', 'amazed', 'astonished', 'unexpected'],
-                'disgust': ['disgusting', 'gross', 'nasty', 'revolting', 'sickening']
-            }
-            
             text_lower = text.lower()
             detected_emotions = {}
             
-            for emotion, keywords in emotion_keywords.items():
+            for emotion, keywords in EMOTION_KEYWORDS.items():
                 count = sum(1 for keyword in keywords if keyword in text_lower)
                 if count > 0:
                     detected_emotions[emotion] = count
@@ -272,24 +328,15 @@ class SentimentAnalyzer:
             return detected_emotions
             
         except Exception as e:
-            logger.error(f"Error detecting emotions: {str(e)}")
+            logger.error("Error detecting emotions: %s", e)
             return {}
     
     def is_tourism_related(self, text):
         """Check if text is tourism-related"""
         try:
-            tourism_keywords = [
-                'sri lanka', 'colombo', 'kandy', 'galle', 'sigiriya', 'anuradhapura',
-                'tourism', 'tourist', 'travel', 'vacation', 'holiday', 'trip',
-                'hotel', 'resort', 'guesthouse', 'accommodation', 'booking',
-                'beach', 'temple', 'culture', 'heritage', 'nature', 'wildlife',
-                'food', 'cuisine', 'restaurant', 'transport', 'airport',
-                'visit', 'explore', 'discover', 'experience', 'adventure'
-            ]
-            
             text_lower = text.lower()
-            return any(keyword in text_lower for keyword in tourism_keywords)
+            return any(keyword in text_lower for keyword in TOURISM_KEYWORDS)
             
         except Exception as e:
-            logger.error(f"Error checking tourism relevance: {str(e)}")
+            logger.error("Error checking tourism relevance: %s", e)
             return False
\ No newline at end of file
@@ -15,13 +15,20 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'postgresql://localhost/tourism_dashboard'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    DATABASE_CONNECT_TIMEOUT = int(os.environ.get('DATABASE_CONNECT_TIMEOUT', 5))  # seconds per new connection
+    SQLALCHEMY_ENGINE_OPTIONS = {'connect_args': {'connect_timeout': DATABASE_CONNECT_TIMEOUT}}
+    AUTO_CREATE_TABLES = False  # create missing tables on startup instead of via migrations/ (flask db upgrade)
     
     # MongoDB Configuration
     MONGODB_URI = os.environ.get('MONGODB_URL') or \
         'mongodb://localhost:27017/tourism_data'
+    MONGODB_MAX_POOL_SIZE = int(os.environ.get('MONGODB_MAX_POOL_SIZE', 50))
+    MONGODB_MIN_POOL_SIZE = int(os.environ.get('MONGODB_MIN_POOL_SIZE', 0))  # >0 opens sockets before a preload fork; PyMongo is not fork-safe
     
     # Redis Configuration
     REDIS_URL = os.environ.get('REDIS_URL') or 'redis://localhost:6379'
+    REDIS_MAX_CONNECTIONS = int(os.environ.get('REDIS_MAX_CONNECTIONS', 50))
+    REDIS_SOCKET_TIMEOUT = int(os.environ.get('REDIS_SOCKET_TIMEOUT', 2))  # seconds per connect or command
     
     # API Keys
     TWITTER_API_KEY = os.environ.get('TWITTER_API_KEY')
@@ -31,14 +38,24 @@ class Config:
     
     OPENWEATHER_API_KEY = os.environ.get('OPENWEATHER_API_KEY')
     GOOGLE_MAPS_API_KEY = os.environ.get('GOOGLE_MAPS_API_KEY')
+    EXTERNAL_API_TIMEOUT = int(os.environ.get('EXTERNAL_API_TIMEOUT', 10))  # seconds per request
+    EXTERNAL_API_RETRIES = int(os.environ.get('EXTERNAL_API_RETRIES', 2))
+    EXTERNAL_API_WORKERS = int(os.environ.get('EXTERNAL_API_WORKERS', 5))  # concurrent upstream requests per collection
     
     # Dashboard Configuration
     DASHBOARD_REFRESH_INTERVAL = int(os.environ.get('DASHBOARD_REFRESH_INTERVAL', 300))  # 5 minutes
     DATA_UPDATE_INTERVAL = int(os.environ.get('DATA_UPDATE_INTERVAL', 600))  # 10 minutes
+    CATALOG_CACHE_TTL = int(os.environ.get('CATALOG_CACHE_TTL', 300))  # hotels, destinations, source countries
+    ANALYTICS_CACHE_TTL = int(os.environ.get('ANALYTICS_CACHE_TTL', 60))  # analytics summary
+    TIME_SERIES_CACHE_TTL = int(os.environ.get('TIME_SERIES_CACHE_TTL', 60))  # arrivals, revenue, occupancy
+    HEALTH_CHECK_TIMEOUT = int(os.environ.get('HEALTH_CHECK_TIMEOUT', 2))  # seconds per database or MongoDB check in /health/deep
+    RESPONSE_STALE_TTL = int(os.environ.get('RESPONSE_STALE_TTL', 86400))  # last good copy kept for database outages
+    MAX_LIST_LIMIT = int(os.environ.get('MAX_LIST_LIMIT', 1000))  # rows returned by a list endpoint at most
     
     # Sentiment Analysis Configuration
     SENTIMENT_ANALYSIS_LANGUAGES = ['en', 'si', 'ta']  # English, Sinhala, Tamil
     SENTIMENT_UPDATE_INTERVAL = int(os.environ.get('SENTIMENT_UPDATE_INTERVAL', 1800))  # 30 minutes
+    SENTIMENT_CACHE_TTL = int(os.environ.get('SENTIMENT_CACHE_TTL', 86400))  # 24 hours
     
     # Forecasting Configuration
     FORECAST_HORIZON_DAYS = int(os.environ.get('FORECAST_HORIZON_DAYS', 30))
@@ -52,6 +69,8 @@ class Config:
     # Logging Configuration
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
     LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs', 'app.log')
+    LOG_BUFFER_CAPACITY = int(os.environ.get('LOG_BUFFER_CAPACITY', 1024))  # records buffered before a file write
+    LOG_FLUSH_INTERVAL = int(os.environ.get('LOG_FLUSH_INTERVAL', 5))  # seconds a record can wait in the buffer
     
     # Security Configuration
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or 'jwt-secret-key-change-in-production'
@@ -61,6 +80,8 @@ class Config:
     # Rate Limiting
     RATELIMIT_DEFAULT = "100 per minute"
     RATELIMIT_STORAGE_URL = REDIS_URL
+    DATA_COLLECT_RATE_LIMIT = int(os.environ.get('DATA_COLLECT_RATE_LIMIT', 5))  # requests per window
+    DATA_COLLECT_RATE_WINDOW = int(os.environ.get('DATA_COLLECT_RATE_WINDOW', 60))  # seconds
     
     # CORS Configuration
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
@@ -99,6 +120,7 @@ class DevelopmentConfig(Config):
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = os.environ.get('DEV_DATABASE_URL') or \
         'postgresql://localhost/tourism_dashboard_dev'
+    AUTO_CREATE_TABLES = True
 
 class ProductionConfig(Config):
     """Production configuration"""
@@ -114,6 +136,7 @@ class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'postgresql://localhost/tourism_dashboard_test'
+    AUTO_CREATE_TABLES = True
     WTF_CSRF_ENABLED = False
 
 # Configuration dictionary
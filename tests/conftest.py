@@ -0,0 +1,98 @@
+import fnmatch
+import os
+import tempfile
+
+import pytest
+import redis
+
+import app as tourism_app
+from app import create_app
+from config import TestingConfig, config
+
+
+class UnitTestConfig(TestingConfig):
+    """Testing configuration that needs no running Postgres, Redis or MongoDB"""
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    AUTO_CREATE_TABLES = False
+    LOG_FILE = os.path.join(tempfile.gettempdir(), 'tourism-dashboard-tests.log')
+
+
+class FakePipeline:
+    """Pipeline that applies queued commands to a FakeRedis on execute"""
+    
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+    
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+    
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """In-memory stand-in for the commands the API issues against Redis"""
+    
+    def __init__(self):
+        self.data = {}
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+    
+    def hset(self, key, mapping):
+        entry = self.data.setdefault(key, {})
+        for field, value in mapping.items():
+            entry[field.encode()] = value if isinstance(value, bytes) else str(value).encode()
+        return len(mapping)
+    
+    def incr(self, key):
+        self.data[key] = self.data.get(key, 0) + 1
+        return self.data[key]
+    
+    def expire(self, key, seconds):
+        return key in self.data
+    
+    def setex(self, key, seconds, value):
+        self.data[key] = value
+        return True
+    
+    def scan_iter(self, match='*', count=None):
+        return [key for key in list(self.data) if fnmatch.fnmatchcase(key, match)]
+    
+    def unlink(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+class DownRedis:
+    """Redis client whose server is unreachable"""
+    
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise redis.ConnectionError('Connection refused')
+        return fail
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setitem(config, 'unit', UnitTestConfig)
+    application = create_app('unit')
+    monkeypatch.setattr(tourism_app, 'redis_client', FakeRedis())
+    return application
+
+
+@pytest.fixture
+def fake_redis(app):
+    return tourism_app.redis_client
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
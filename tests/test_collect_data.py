@@ -0,0 +1,83 @@
+import pytest
+
+from app.api import routes
+
+
+class FakeCollector:
+    """Records which collection steps a request ran"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def collect_all_data(self, start_date=None, end_date=None):
+        self.calls.append('all')
+        return 10
+    
+    def collect_tourist_arrivals(self, start_date=None, end_date=None):
+        self.calls.append('arrivals')
+        return 3
+    
+    def collect_hotel_data(self):
+        self.calls.append('hotels')
+        return 2
+    
+    def collect_revenue_data(self, start_date=None, end_date=None):
+        self.calls.append('revenue')
+        return 4
+    
+    def collect_weather_data(self):
+        self.calls.append('weather')
+        return 1
+
+
+@pytest.fixture
+def collector(app, monkeypatch):
+    collector = FakeCollector()
+    monkeypatch.setattr(routes, '_get_collector', lambda: collector)
+    return collector
+
+
+def post_collect(client, data):
+    return client.post('/api/data/collect', data=data, content_type='application/json')
+
+
+@pytest.mark.parametrize('body', [b'', b'  \n'])
+def test_empty_body_collects_everything(client, collector, body):
+    response = post_collect(client, body)
+    
+    assert response.status_code == 200
+    assert response.get_json()['message'] == 'Collected 10 records'
+    assert response.get_json()['data_type'] == 'all'
+    assert collector.calls == ['all']
+
+
+def test_single_data_type_runs_only_its_collector(client, collector):
+    response = post_collect(client, b'{"data_type": "hotels"}')
+    
+    assert response.status_code == 200
+    assert response.get_json()['message'] == 'Collected 2 records'
+    assert collector.calls == ['hotels']
+
+
+def test_collection_drops_cached_responses(client, collector, fake_redis):
+    fake_redis.data[f'{routes.RESPONSE_CACHE_PREFIX}api.get_hotels:limit=100'] = {b'body': b''}
+    
+    post_collect(client, b'{"data_type": "hotels"}')
+    
+    assert not any(key.startswith(routes.RESPONSE_CACHE_PREFIX) for key in fake_redis.data)
+
+
+@pytest.mark.parametrize('body, error', [
+    (b'{bad', 'Invalid JSON body'),
+    (b'[1]', 'Request body must be a JSON object'),
+    (b'"arrivals"', 'Request body must be a JSON object'),
+    (b'{"data_type": ["arrivals"]}', 'data_type must be a string'),
+    (b'{"data_type": {"name": "arrivals"}}', 'data_type must be a string'),
+    (b'{"data_type": "flights"}', 'Unsupported data_type: flights'),
+])
+def test_invalid_bodies_are_rejected_without_collecting(client, collector, body, error):
+    response = post_collect(client, body)
+    
+    assert response.status_code == 400
+    assert response.get_json() == {'success': False, 'error': error}
+    assert collector.calls == []
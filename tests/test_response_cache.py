@@ -0,0 +1,105 @@
+import gzip
+
+import pytest
+from flask import jsonify
+from sqlalchemy.exc import OperationalError
+
+import app as tourism_app
+from app.api.routes import RESPONSE_CACHE_PREFIX, cached_response
+from tests.conftest import DownRedis
+
+
+@pytest.fixture
+def view_state(app):
+    """Register a cached view whose outcome each test controls"""
+    state = {'calls': 0, 'status': 200, 'error': None}
+    
+    @cached_response('TIME_SERIES_CACHE_TTL', params=('start_date', 'limit'))
+    def cached_view():
+        state['calls'] += 1
+        if state['error']:
+            raise state['error']
+        return jsonify({'calls': state['calls']}), state['status']
+    
+    app.add_url_rule('/test/cached', 'cached_view', cached_view)
+    return state
+
+
+def expire_fresh_copies(fake_redis):
+    for entry in fake_redis.data.values():
+        entry[b'fresh_until'] = b'0'
+
+
+def test_fresh_copy_is_served_without_running_the_view(client, view_state):
+    first = client.get('/test/cached')
+    second = client.get('/test/cached')
+    
+    assert view_state['calls'] == 1
+    assert second.status_code == 200
+    assert second.get_json() == first.get_json() == {'calls': 1}
+    assert second.headers['Cache-Control'] == 'public, max-age=60'
+
+
+def test_gzip_body_is_served_to_clients_that_accept_it(client, view_state):
+    response = client.get('/test/cached', headers={'Accept-Encoding': 'gzip'})
+    
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.data) == client.get('/test/cached').data
+
+
+def test_matching_etag_gets_an_empty_304(client, view_state):
+    etag = client.get('/test/cached').headers['ETag']
+    
+    response = client.get('/test/cached', headers={'If-None-Match': etag})
+    
+    assert response.status_code == 304
+    assert response.data == b''
+
+
+def test_stale_copy_is_served_when_the_database_fails(client, view_state, fake_redis):
+    client.get('/test/cached')
+    expire_fresh_copies(fake_redis)
+    view_state['error'] = OperationalError('SELECT 1', {}, Exception('server closed the connection'))
+    
+    response = client.get('/test/cached')
+    
+    assert view_state['calls'] == 2
+    assert response.status_code == 200
+    assert response.get_json() == {'calls': 1}
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+
+def test_database_error_without_a_stored_copy_propagates(client, view_state):
+    view_state['error'] = OperationalError('SELECT 1', {}, Exception('server closed the connection'))
+    
+    with pytest.raises(OperationalError):
+        client.get('/test/cached')
+
+
+def test_non_200_responses_are_not_stored(client, view_state, fake_redis):
+    view_state['status'] = 404
+    
+    assert client.get('/test/cached').status_code == 404
+    assert client.get('/test/cached').status_code == 404
+    assert view_state['calls'] == 2
+    assert not any(key.startswith(RESPONSE_CACHE_PREFIX) for key in fake_redis.data)
+
+
+def test_redis_outage_fails_open(client, view_state, monkeypatch):
+    monkeypatch.setattr(tourism_app, 'redis_client', DownRedis())
+    
+    assert client.get('/test/cached').get_json() == {'calls': 1}
+    assert client.get('/test/cached').get_json() == {'calls': 2}
+
+
+@pytest.mark.parametrize('query', [
+    'limit=1000&start_date=2024-01-05',
+    'limit=5000&start_date=2024-1-5',
+    'start_date=2024-01-05&limit=01000&unused=1',
+])
+def test_equivalent_queries_share_one_entry(client, view_state, fake_redis, query):
+    client.get('/test/cached?limit=1000&start_date=2024-01-05')
+    client.get(f'/test/cached?{query}')
+    
+    assert view_state['calls'] == 1
+    assert len(fake_redis.data) == 1